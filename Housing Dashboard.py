@@ -1,10 +1,17 @@
 
 # ======== IMPORTS ========
+import functools
+import itertools
+import os
 import dash
-from dash import dcc, html, Input, Output, State, dash_table
+from dash import dcc, html, Input, Output, State, MATCH, ctx, dash_table, clientside_callback, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 import numpy as np
 
 # ======== CONFIGURATION ========
@@ -12,43 +19,129 @@ LIGHT_THEME = dbc.themes.BOOTSTRAP
 DARK_THEME = dbc.themes.CYBORG
 DEFAULT_THEME = 'dark'
 DEFAULT_PORT = 8060
+DATA_FILE = "HousePricePrediction.xlsx"
+DATA_CACHE = "HousePricePrediction.parquet"  # Regenerated whenever DATA_FILE is newer
+
+# Columns read from the workbook (Id is skipped) and their compact dtypes
+USED_COLS = [
+    'MSSubClass', 'MSZoning', 'LotArea', 'LotConfig', 'BldgType', 'OverallCond',
+    'YearBuilt', 'YearRemodAdd', 'Exterior1st', 'BsmtFinSF2', 'TotalBsmtSF', 'SalePrice'
+]
+COLUMN_DTYPES = {
+    'MSZoning': 'category',
+    'BldgType': 'category',
+    'LotConfig': 'category',
+    'SalePrice': 'float32',     # Missing for unsold houses
+    'YearBuilt': 'int16',
+    'YearRemodAdd': 'int16',
+    'OverallCond': 'int8',
+    'TotalBsmtSF': 'float32',
+    'BsmtFinSF2': 'float32',
+    'LotArea': 'float32',
+    'MSSubClass': 'int16'
+}
 
 # ======== DATA LOADING ========
 def load_data():
-    """Load housing data."""
-    df = pd.read_excel("HousePricePrediction.xlsx")
-    # Remove Id column from the dataset
-    if 'Id' in df.columns:
-        df = df.drop('Id', axis=1)
+    """Load housing data, reusing a parquet cache of the Excel file when fresh."""
+    if (os.path.exists(DATA_CACHE)
+            and os.path.getmtime(DATA_CACHE) >= os.path.getmtime(DATA_FILE)):
+        df = pd.read_parquet(DATA_CACHE)
+        # Rebuild a cache written before USED_COLS or COLUMN_DTYPES changed
+        if (list(df.columns) == USED_COLS
+                and all(str(df[col].dtype) == dtype for col, dtype in COLUMN_DTYPES.items())):
+            return df
+    
+    read_kwargs = dict(usecols=USED_COLS, dtype=COLUMN_DTYPES)  # Skips Id and dtype inference
+    try:
+        df = pd.read_excel(DATA_FILE, engine="calamine", **read_kwargs)  # Much faster than openpyxl
+    except (ImportError, ValueError):
+        df = pd.read_excel(DATA_FILE, engine="openpyxl",
+                           engine_kwargs={"read_only": True, "data_only": True}, **read_kwargs)
+    
+    try:
+        df.to_parquet(DATA_CACHE)
+    except (ImportError, OSError):
+        pass  # Cache is optional; read the workbook again next start
     return df
 
 df = load_data()
 
+# Contiguous float64 block of the numeric columns for numpy correlation kernels
+NUMERIC_COLS = df.select_dtypes(include=['number']).columns
+NUMERIC_VALUES = np.ascontiguousarray(df[NUMERIC_COLS].to_numpy(dtype=np.float64))
+
+def _category_index(column):
+    """Map each category of a column to the sorted row positions holding it."""
+    codes = df[column].cat.codes.to_numpy()  # Integer codes, -1 for missing
+    return {cat: np.flatnonzero(codes == i) for i, cat in enumerate(df[column].cat.categories)}
+
+# Per-category row positions so filtering is a dict lookup instead of a table scan
+ALL_ROWS = np.arange(len(df))
+NO_ROWS = ALL_ROWS[:0]
+ZONING_INDEX = _category_index('MSZoning')
+BLDGTYPE_INDEX = _category_index('BldgType')
+
+# Filter dropdown options, built once instead of on every page render
+ZONING_OPTIONS = [{'label': zone, 'value': zone} for zone in df['MSZoning'].dropna().unique().tolist()]
+BLDGTYPE_OPTIONS = [{'label': b, 'value': b} for b in df['BldgType'].dropna().unique().tolist()]
+
+# Year offsets and basement areas for bincount-based "mean by year" aggregation
+YEAR_MIN = int(df['YearBuilt'].min())
+YEAR_SPAN = int(df['YearBuilt'].max()) - YEAR_MIN + 1
+YEAR_IDX = (df['YearBuilt'].to_numpy() - YEAR_MIN).astype(np.int32)
+TBSMT_VALID = df['TotalBsmtSF'].notna().to_numpy()
+TBSMT_VALUES = df['TotalBsmtSF'].fillna(0).to_numpy(dtype=np.float64)
+
+# Per-row arrays and zoning codes feeding the numpy-built dashboard figures
+SALEPRICE = df['SalePrice'].to_numpy(dtype=np.float64)
+YEARBUILT = df['YearBuilt'].to_numpy()
+OVERALLCOND = df['OverallCond'].to_numpy()
+ZONING_CODES = df['MSZoning'].cat.codes.to_numpy()
+ZONING_NAMES = list(df['MSZoning'].cat.categories)
+BLDGTYPE_CODES = df['BldgType'].cat.codes.to_numpy()
+BLDGTYPE_NAMES = np.array(df['BldgType'].cat.categories)
+LOTAREA = df['LotArea'].to_numpy(dtype=np.float64)
+PALETTE = px.colors.sequential.Plasma_r
+
 # ======== APP INITIALIZATION ========
 app = dash.Dash(
     __name__, 
     use_pages=False,
     external_stylesheets=[DARK_THEME],
-    suppress_callback_exceptions=True
+    suppress_callback_exceptions=True,
+    compress=True  # Gzip callback responses (requires flask-compress)
 )
 app.title = 'Housing Price Analysis Dashboard'
 
+# Server-side figure cache shared by every user of this process
+cache = Cache(app.server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 3600})
+
 # ======== HELPER FUNCTIONS ========
 def get_template(theme):
     """Return appropriate plotly template based on theme."""
     return 'plotly_dark' if theme == 'dark' else 'plotly_white'
 
-def create_filters(prefix=""):
-    """Create reusable filter controls with optional ID prefix."""
+def create_filters(prefix="", pattern=False):
+    """Create reusable filter controls with optional ID prefix.
+    
+    With pattern=True the components get pattern-matching IDs keyed by page,
+    so a single MATCH callback can serve the filters on every page.
+    """
     id_prefix = f"{prefix}-" if prefix else ""  # For unique component IDs
     
+    def component_id(name):
+        return {'type': name, 'page': prefix} if pattern else f'{id_prefix}{name}'
+    
     return dbc.Row([
+        # Last filters the page's charts were drawn for (see check_filters)
+        dcc.Store(id=component_id('filter-store')),
         # Zoning type filter (residential, commercial, etc.)
         dbc.Col([
             html.Label('MSZoning'),
             dcc.Dropdown(
-                id=f'{id_prefix}zoning-filter',
-                options=[{'label': zone, 'value': zone} for zone in df['MSZoning'].dropna().unique()],
+                id=component_id('zoning-filter'),
+                options=ZONING_OPTIONS,
                 placeholder='Select zoning',
                 clearable=True
             )
@@ -57,74 +150,169 @@ def create_filters(prefix=""):
         dbc.Col([
             html.Label('BldgType'),
             dcc.Dropdown(
-                id=f'{id_prefix}bldgtype-filter',
-                options=[{'label': b, 'value': b} for b in df['BldgType'].dropna().unique()],
+                id=component_id('bldgtype-filter'),
+                options=BLDGTYPE_OPTIONS,
                 placeholder='Select building type',
                 clearable=True
             )
         ], width=6)
     ], className="mb-4")  # Bottom margin
 
-def filter_dataframe(dataframe, zoning=None, bldgtype=None):
-    """Filter dataframe based on zoning and building type selections."""
-    filtered_df = dataframe.copy()  # Avoid modifying original
+@functools.lru_cache(maxsize=64)  # Covers every (zoning, bldgtype) combo
+def _filtered_indices(zoning=None, bldgtype=None):
+    """Return row positions of the global df matching the filter selections."""
+    idx = ALL_ROWS
     
     if zoning:
-        filtered_df = filtered_df[filtered_df['MSZoning'] == zoning]
+        idx = ZONING_INDEX.get(zoning, NO_ROWS)
     if bldgtype:
-        filtered_df = filtered_df[filtered_df['BldgType'] == bldgtype]
+        bldg_idx = BLDGTYPE_INDEX.get(bldgtype, NO_ROWS)
+        idx = np.intersect1d(idx, bldg_idx, assume_unique=True) if zoning else bldg_idx
         
-    return filtered_df
+    return idx
 
-# ======== VISUALIZATION FUNCTIONS ========
-def create_correlation_heatmap(df, theme='dark'):
-    """Create a correlation heatmap for numerical variables."""
-    numeric_df = df.select_dtypes(include=['number'])
-    numeric_df = numeric_df.dropna(axis=1, how='all')
-    corr_matrix = numeric_df.corr()
+def _group_rows(codes, n_groups):
+    """Split positions into one array per integer group code (-1 codes are dropped)."""
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    return [order[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+def _box_stats(values):
+    """Return Tukey box-plot statistics and the outlying points of a 1D array."""
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    reach = 1.5 * (q3 - q1)
+    inside = (values >= q1 - reach) & (values <= q3 + reach)
+    stats = dict(q1=[q1], median=[median], q3=[q3],
+                 lowerfence=[values[inside].min()], upperfence=[values[inside].max()])
+    return stats, values[~inside]
+
+def _histogram_traces(values, groups, names, nbins=50):
+    """Stacked-histogram bars over shared bin edges, one trace per group of positions."""
+    edges = np.histogram_bin_edges(values[np.concatenate(groups)], bins=nbins)
+    bins = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, nbins - 1)
+    return [
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2, y=np.bincount(bins[rows], minlength=nbins), width=np.diff(edges),
+            name=names[i], legendgroup=names[i], marker_color=PALETTE[i % len(PALETTE)]
+        )
+        for i, rows in enumerate(groups) if rows.size
+    ]
+
+def _box_traces(position, values, name, color, horizontal=False, **trace_kwargs):
+    """Box trace from precomputed statistics, plus a marker trace for its outliers."""
+    stats, outliers = _box_stats(values)
+    value_axis, position_axis = ('x', 'y') if horizontal else ('y', 'x')
+    traces = [go.Box(
+        **{position_axis: [position]}, orientation='h' if horizontal else 'v',
+        name=name, marker_color=color, **stats, **trace_kwargs
+    )]
+    if outliers.size:
+        traces.append(go.Scatter(
+            **{value_axis: outliers, position_axis: [position] * outliers.size}, mode='markers',
+            name=name, marker_color=color, **{**trace_kwargs, 'showlegend': False}
+        ))
+    return traces
+
+def _pairwise_corrcoef(values):
+    """Pearson correlation of the columns of a 2D array using pairwise-complete rows.
+    
+    Matches DataFrame.corr() NaN handling, but as a few matrix products instead
+    of a Python-level loop over column pairs.
+    """
+    valid = ~np.isnan(values)
+    weights = valid.astype(np.float64)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Center columns first for numerical stability (correlation is shift-invariant)
+        means = np.where(valid, values, 0.0).sum(axis=0) / valid.sum(axis=0)
+        centered = np.where(valid, values - means, 0.0)
+        
+        n = weights.T @ weights                  # Rows where both columns are present
+        sx = centered.T @ weights                # Sum of column i over those rows
+        sxx = (centered * centered).T @ weights  # Sum of squares of column i over those rows
+        sxy = centered.T @ centered              # Cross products
+        
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n
+        var[var <= 1e-12 * sxx] = 0.0           # Constant columns -> NaN, like pandas
+        denom = np.sqrt(var * var.T)
+        corr = np.where(denom > 0, cov / denom, np.nan)
+        
+    return np.clip(corr, -1, 1)
+
+def _corr_artifacts(zoning=None, bldgtype=None):
+    """Return the masked correlation matrix and top SalePrice correlations for a filter combo."""
+    sub = NUMERIC_VALUES[_filtered_indices(zoning, bldgtype)]
+    corr = _pairwise_corrcoef(sub)
     
-    mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
-    masked_corr = corr_matrix.mask(mask)
+    # Heatmap matrix: drop empty columns and hide the redundant upper triangle
+    has_data = ~np.isnan(sub).all(axis=0)
+    cols = NUMERIC_COLS[has_data]
+    corr32 = corr[np.ix_(has_data, has_data)].astype(np.float32)  # Compact figure payload
+    corr32[np.triu_indices_from(corr32)] = np.nan
+    # The first row and last column are now all NaN, so don't ship them at all
+    masked_corr = pd.DataFrame(corr32[1:, :-1], index=cols[1:], columns=cols[:-1])
     
+    # Bar chart series: strongest positive and negative correlations with SalePrice
+    k = NUMERIC_COLS.get_loc('SalePrice')
+    correlations = pd.Series(corr[k], index=NUMERIC_COLS).sort_values(ascending=False)
+    correlations = correlations.drop('SalePrice', errors='ignore')
+    top_correlations = pd.concat([
+        correlations.head(10),
+        correlations.tail(5)
+    ]).astype(np.float32)
+    
+    return masked_corr, top_correlations
+
+# Correlation artifacts for every filter combo, including the unfiltered marginals
+FILTER_COMBOS = list(itertools.product([None, *df['MSZoning'].cat.categories],
+                                       [None, *df['BldgType'].cat.categories]))
+CORR_CACHE = {key: _corr_artifacts(*key) for key in FILTER_COMBOS}
+
+# Row count of every filter combo, so callbacks can skip combos with nothing to plot
+LEN_CACHE = {key: len(_filtered_indices(*key)) for key in FILTER_COMBOS}
+
+def check_filters(zoning, bldgtype, last_filters):
+    """Raise PreventUpdate when a filter change has nothing new to draw."""
+    if LEN_CACHE.get((zoning, bldgtype), 0) < 2:
+        raise PreventUpdate  # Too few rows to plot or correlate
+    if ctx.triggered_id is not None and last_filters == [zoning, bldgtype]:
+        raise PreventUpdate  # Re-fired with the filters already drawn
 
+# ======== VISUALIZATION FUNCTIONS ========
+def create_correlation_heatmap(masked_corr, theme='dark'):
+    """Create a correlation heatmap from a precomputed masked correlation matrix."""
+    # Whole percentages are all the display needs and encode far smaller than raw
+    # floats; they stay float32 (not int8) because NaN keeps the masked cells blank
+    percent_corr = (masked_corr * 100).round()
     
     fig = px.imshow(
-        masked_corr,
+        percent_corr,
         
-        text_auto='.2f',
+        text_auto='.0f',
         labels=dict(color="Correlation"),
-        x=masked_corr.columns,
-        y=masked_corr.columns,
+        x=percent_corr.columns,
+        y=percent_corr.index,
         title='Feature Correlation Heatmap',
         template=get_template(theme),
         color_continuous_scale=px.colors.sequential.Plasma,
         
-        zmin=-1,
-        zmax=1
+        zmin=-100,
+        zmax=100
     )
     
+    fig.update_traces(hovertemplate='%{y} vs %{x}: %{z:.0f}%<extra></extra>')
     fig.update_layout(
         height=600,
         xaxis=dict(tickangle=45, tickfont=dict(size=10)),
         yaxis=dict(tickfont=dict(size=10)),
-        coloraxis_colorbar=dict(title="Correlation", thicknessmode="pixels", thickness=20)
+        coloraxis_colorbar=dict(title="Correlation", ticksuffix="%", thicknessmode="pixels", thickness=20)
     )
     
     return fig
 
-def create_saleprice_correlation_chart(df, theme='dark'):
-    """Create a horizontal bar chart showing correlations with SalePrice."""
-    numeric_df = df.select_dtypes(include=['number'])
-    correlations = numeric_df.corr()['SalePrice'].sort_values(ascending=False)
-    correlations = correlations.drop('SalePrice', errors='ignore')
-    
-    top_correlations = pd.concat([
-        correlations.head(10),
-        correlations.tail(5)
-    ])
-    
-
-    
+def create_saleprice_correlation_chart(top_correlations, theme='dark'):
+    """Create a horizontal bar chart from precomputed correlations with SalePrice."""
     fig = px.bar(
         x=top_correlations.values,
         y=top_correlations.index,
@@ -141,7 +329,7 @@ def create_saleprice_correlation_chart(df, theme='dark'):
         type='line',
         x0=0, y0=-0.5,
         x1=0, y1=len(top_correlations)-0.5,
-        line=dict(color='white' if theme == 'dark' else 'black', width=1, dash='dash')
+        line=dict(width=1, dash='dash')  # Color from the template's shapedefaults, so restyle recolors it
     )
     
     fig.update_layout(
@@ -153,6 +341,14 @@ def create_saleprice_correlation_chart(df, theme='dark'):
     
     return fig
 
+@cache.memoize()
+def _build_corr_figs(zoning, bldgtype, theme):
+    """Build (and memoize) the correlation heatmap and bar chart for a filter combo."""
+    masked_corr, top_correlations = CORR_CACHE[(zoning, bldgtype)]  # Precomputed at startup
+    heatmap_fig = create_correlation_heatmap(masked_corr, theme)
+    barchart_fig = create_saleprice_correlation_chart(top_correlations, theme)
+    return heatmap_fig.to_dict(), barchart_fig.to_dict()  # Plain dicts are cheap to (un)pickle
+
 # ======== LAYOUT COMPONENTS ========
 navbar = dbc.NavbarSimple(
     children=[
@@ -171,7 +367,7 @@ navbar = dbc.NavbarSimple(
 )
 
 # ======== PAGE LAYOUTS ========
-def dashboard1(theme):
+def dashboard1():
     """Main dashboard with trend analysis charts."""
     return html.Div([
         create_filters(),
@@ -187,11 +383,10 @@ def dashboard1(theme):
                     dbc.Col(dcc.Graph(id='avg-basement-by-year'), md=6)
                 ])
             ])
-        ], className="mb-4", style={"backgroundColor": "#1e1e1e" if theme == 'dark' else 'white', 
-                                   "borderRadius": "10px"})
+        ], className="mb-4 themed-card")
     ])
 
-def dashboard2(theme):
+def dashboard2():
     """Market overview dashboard."""
     return html.Div([
         create_filters("insights"),
@@ -207,16 +402,70 @@ def dashboard2(theme):
                     dbc.Col(dcc.Graph(id='lotconfig-saleprice'), md=6)
                 ])
             ])
-        ], style={"backgroundColor": "#1e1e1e" if theme == 'dark' else 'white', 
-                 "borderRadius": "10px"})
+        ], className="themed-card")
     ])
 
-def insghts(theme):
+# Descriptive prose for the insghts page; pure text, so the tree is built once and
+# its color follows the theme through CSS
+INSGHTS_TEXT = dbc.Card([
+    dbc.CardHeader("Dashboard Visualization Insights"),
+    dbc.CardBody([
+        dbc.Row([
+            dbc.Col([
+                html.H5("Sale Price Distribution", className="mt-2"),
+                html.P([
+                    "• The price distribution likely shows a right-skewed pattern typical of housing prices", html.Br(),
+                    "• There may be a few high-value outliers stretching the upper end of the distribution", html.Br(),
+                    "• The median price is likely a better metric than mean due to skewness"
+                ]),
+
+                html.H5("Year Built vs Sale Price", className="mt-4"),
+                html.P([
+                    "• Newer homes generally command higher prices", html.Br(),
+                    "• There may be certain \"vintage\" periods where homes retain special value", html.Br(),
+                    "• The relationship is likely non-linear, with recent construction showing steeper price increases"
+                ]),
+            ], md=4),
+
+            dbc.Col([
+                html.H5("Sale Price by Overall Condition", className="mt-2"),
+                html.P([
+                    "• Higher condition ratings likely correlate with higher prices", html.Br(),
+                    "• The spread (variability) of prices probably increases with better condition ratings", html.Br(),
+                    "• Condition 5 (average) likely has the most observations"
+                ]),
+
+                html.H5("Average Basement Area by Year Built", className="mt-4"),
+                html.P([
+                    "• Basement sizes have likely changed over time, reflecting changing construction trends", html.Br(),
+                    "• Older homes may have smaller or larger basements depending on the region and era", html.Br(),
+                    "• There may be noticeable \"jumps\" in basement sizes corresponding to significant changes in building codes or preferences"
+                ])
+            ], md=4),
+
+            dbc.Col([
+                html.H5("Lot Area vs Sale Price", className="mt-2"),
+                html.P([
+                    "• Larger lots generally command higher prices, but with diminishing returns", html.Br(),
+                    "• Different zoning types show different price-to-lot-size relationships", html.Br(),
+                    "• Some zones may show stronger correlation between lot size and price than others"
+                ]),
+
+                html.H5("Building Type Analysis", className="mt-4"),
+                html.P([
+                    "• Single-family detached homes likely command the highest average prices", html.Br(),
+                    "• Townhomes and condos may show better price efficiency (price per square foot)", html.Br(),
+                    "• Certain building types may be concentrated in specific neighborhoods or zoning areas"
+                ])
+            ], md=4)
+        ])
+    ], className="insight-text")
+], className="mb-4 themed-card")
+
+def insghts():
     """Insights page with correlation analyses."""
-    text_color = 'white' if theme == 'dark' else 'black'
-    
     return html.Div([
-        create_filters("insghts"),
+        create_filters("insghts", pattern=True),
         
         # Correlation analysis card
         dbc.Card([
@@ -225,170 +474,100 @@ def insghts(theme):
                 dbc.Row([
                     dbc.Col([
                         html.H5("Feature Correlation Matrix", className="text-center"),
-                        dcc.Graph(id='insghts-correlation-heatmap')
+                        dcc.Graph(id={'type': 'correlation-heatmap', 'page': 'insghts'})
                     ], md=6),
                     
                     dbc.Col([
                         html.H5("Features Most Correlated with Sale Price", className="text-center"),
-                        dcc.Graph(id='insghts-correlation-chart')
+                        dcc.Graph(id={'type': 'correlation-chart', 'page': 'insghts'})
                     ], md=6)
                 ])
             ])
-        ], style={"backgroundColor": "#1e1e1e" if theme == 'dark' else 'white', 
-                 "borderRadius": "10px"}, className="mb-4"),
+        ], className="mb-4 themed-card"),
         
-        # Dashboard descriptions
-        dbc.Card([
-            dbc.CardHeader("Dashboard Visualization Insights"),
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col([
-                        html.H5("Sale Price Distribution", className="mt-2", style={"color": text_color}),
-                        html.P([
-                            "• The price distribution likely shows a right-skewed pattern typical of housing prices", html.Br(),
-                            "• There may be a few high-value outliers stretching the upper end of the distribution", html.Br(),
-                            "• The median price is likely a better metric than mean due to skewness"
-                        ], style={"color": text_color}),
-                        
-                        html.H5("Year Built vs Sale Price", className="mt-4", style={"color": text_color}),
-                        html.P([
-                            "• Newer homes generally command higher prices", html.Br(),
-                            "• There may be certain \"vintage\" periods where homes retain special value", html.Br(),
-                            "• The relationship is likely non-linear, with recent construction showing steeper price increases"
-                        ], style={"color": text_color}),
-                    ], md=4),
-                    
-                    dbc.Col([
-                        html.H5("Sale Price by Overall Condition", className="mt-2", style={"color": text_color}),
-                        html.P([
-                            "• Higher condition ratings likely correlate with higher prices", html.Br(),
-                            "• The spread (variability) of prices probably increases with better condition ratings", html.Br(),
-                            "• Condition 5 (average) likely has the most observations"
-                        ], style={"color": text_color}),
-                        
-                        html.H5("Average Basement Area by Year Built", className="mt-4", style={"color": text_color}),
-                        html.P([
-                            "• Basement sizes have likely changed over time, reflecting changing construction trends", html.Br(),
-                            "• Older homes may have smaller or larger basements depending on the region and era", html.Br(),
-                            "• There may be noticeable \"jumps\" in basement sizes corresponding to significant changes in building codes or preferences"
-                        ], style={"color": text_color})
-                    ], md=4),
-                    
-                    dbc.Col([
-                        html.H5("Lot Area vs Sale Price", className="mt-2", style={"color": text_color}),
-                        html.P([
-                            "• Larger lots generally command higher prices, but with diminishing returns", html.Br(),
-                            "• Different zoning types show different price-to-lot-size relationships", html.Br(),
-                            "• Some zones may show stronger correlation between lot size and price than others"
-                        ], style={"color": text_color}),
-                        
-                        html.H5("Building Type Analysis", className="mt-4", style={"color": text_color}),
-                        html.P([
-                            "• Single-family detached homes likely command the highest average prices", html.Br(),
-                            "• Townhomes and condos may show better price efficiency (price per square foot)", html.Br(),
-                            "• Certain building types may be concentrated in specific neighborhoods or zoning areas"
-                        ], style={"color": text_color})
-                    ], md=4)
-                ])
-            ])
-        ], style={"backgroundColor": "#1e1e1e" if theme == 'dark' else 'white', 
-                 "borderRadius": "10px"}, className="mb-4")
+        # Dashboard descriptions (static, built once at import)
+        INSGHTS_TEXT
     ])
 
-def layout_table(theme):
-    """Data table page showing raw data."""
-    # Style based on current theme
-    style = {
-        'backgroundColor': '#1e1e1e' if theme == 'dark' else 'white',
-        'color': 'white' if theme == 'dark' else 'black'
-    }
+# Table contents serialized once; colors come from assets/theme.css
+DATA_COLUMNS = [{'name': col, 'id': col} for col in df.columns]
+DATA_RECORDS = df.to_dict('records')
 
+def layout_table():
+    """Data table page showing raw data."""
     return html.Div([
-        html.H4("Housing Data Table", style={'textAlign': 'center', **style}),
-        # Interactive data table with pagination
+        html.H4("Housing Data Table", className="themed-text", style={'textAlign': 'center'}),
+        # Interactive data table, virtualized so only visible rows render
         dash_table.DataTable(
-            columns=[{'name': col, 'id': col} for col in df.columns],
-            data=df.to_dict('records'),
-            page_size=10,  # Records per page
-            style_table={'overflowX': 'auto'},  # Horizontal scroll
-            style_header={
-                'backgroundColor': '#111111' if theme == 'dark' else '#e1e1e1',
-                'fontWeight': 'bold',
-                'color': style['color']
-            },
-            style_data={
-                'backgroundColor': style['backgroundColor'], 
-                'color': style['color']
-            }
+            columns=DATA_COLUMNS,
+            data=DATA_RECORDS,
+            virtualization=True,
+            page_action='none',
+            fixed_rows={'headers': True},
+            style_table={'height': '600px', 'overflowY': 'auto', 'overflowX': 'auto'},  # Scroll both ways
+            style_header={'fontWeight': 'bold'}
         )
     ])
 
+# Serialized templates so the browser can switch figure themes without the server
+THEME_TEMPLATES = {theme: pio.templates[get_template(theme)].to_plotly_json() for theme in ('dark', 'light')}
+
 # Main application layout
 app.layout = html.Div([
     dcc.Location(id='url'),  # For URL routing
     dcc.Store(id='theme-store', data=DEFAULT_THEME),  # Theme state storage
+    dcc.Store(id='template-store', data=THEME_TEMPLATES),  # Plotly templates for clientside restyling
     navbar,  # Top navigation bar
     html.Div(id='page-content', className="container-fluid p-4")  # Content container
 ])
 
 # ======== CALLBACKS ========
-# Theme toggle callback
-@app.callback(
+# Theme toggle callback (runs in the browser)
+clientside_callback(
+    "function(value) { return value ? 'dark' : 'light'; }",
     Output('theme-store', 'data'),
     Input('theme-switch', 'value')
 )
-def toggle_theme(value):
-    """Toggle between light and dark theme."""
-    return 'dark' if value else 'light'
+
+# Restyle figures and cards in place when the theme changes (assets/clientside.js)
+clientside_callback(
+    ClientsideFunction(namespace='theme', function_name='restyle'),
+    Output('page-content', 'className'),
+    Input('theme-store', 'data'),
+    State('template-store', 'data')
+)
 
 # Routing callback
 @app.callback(
     Output('page-content', 'children'),
-    Input('url', 'pathname'),  # URL determines which page to show
-    State('theme-store', 'data')  # Current theme to apply
+    Input('url', 'pathname')  # URL determines which page to show
 )
-def display_page(pathname, theme):
+def display_page(pathname):
     """Route to the appropriate page based on URL pathname."""
     if pathname == '/data':
-        return layout_table(theme)
+        return layout_table()
     elif pathname == '/insights':
-        return dashboard2(theme)
+        return dashboard2()
     elif pathname == '/insghts':
-        return insghts(theme)
-    return dashboard1(theme)  # Default to main dashboard
+        return insghts()
+    return dashboard1()  # Default to main dashboard
 
 # ======== VISUALIZATION CALLBACKS ========
-# Dashboard2 correlation charts callback
+# Correlation charts callback, shared by every page with pattern-matched filters
 @app.callback(
-    Output('correlation-heatmap', 'figure'),
-    Output('saleprice-correlation-chart', 'figure'),
-    Input('insights-zoning-filter', 'value'),
-    Input('insights-bldgtype-filter', 'value'),
+    Output({'type': 'correlation-heatmap', 'page': MATCH}, 'figure'),
+    Output({'type': 'correlation-chart', 'page': MATCH}, 'figure'),
+    Output({'type': 'filter-store', 'page': MATCH}, 'data'),
+    Input({'type': 'zoning-filter', 'page': MATCH}, 'value'),
+    Input({'type': 'bldgtype-filter', 'page': MATCH}, 'value'),
     State('theme-store', 'data'),
+    State({'type': 'filter-store', 'page': MATCH}, 'data'),
     prevent_initial_call='initial_duplicate'
 )
-def update_correlation_charts(zoning, bldgtype, theme):
-    """Update correlation charts for dashboard2."""
-    filtered_df = filter_dataframe(df, zoning, bldgtype)  # Apply filters
-    heatmap_fig = create_correlation_heatmap(filtered_df, theme)
-    barchart_fig = create_saleprice_correlation_chart(filtered_df, theme)
-    return heatmap_fig, barchart_fig
-
-# Insghts page correlation charts callback
-@app.callback(
-    Output('insghts-correlation-heatmap', 'figure'),
-    Output('insghts-correlation-chart', 'figure'),
-    Input('insghts-zoning-filter', 'value'),
-    Input('insghts-bldgtype-filter', 'value'),
-    State('theme-store', 'data'),
-    prevent_initial_call='initial_duplicate'
-)
-def update_insghts_correlation_charts(zoning, bldgtype, theme):
-    """Update correlation charts for insghts page."""
-    filtered_df = filter_dataframe(df, zoning, bldgtype)  # Apply filters
-    heatmap_fig = create_correlation_heatmap(filtered_df, theme)
-    barchart_fig = create_saleprice_correlation_chart(filtered_df, theme)
-    return heatmap_fig, barchart_fig
+def update_correlation_charts(zoning, bldgtype, theme, last_filters):
+    """Update correlation charts for the page whose filters changed."""
+    check_filters(zoning, bldgtype, last_filters)
+    return *_build_corr_figs(zoning, bldgtype, theme), [zoning, bldgtype]
 
 # Dashboard1 main graphs callback
 @app.callback(
@@ -396,48 +575,72 @@ def update_insghts_correlation_charts(zoning, bldgtype, theme):
     Output('yearbuilt-saleprice', 'figure'),
     Output('condition-saleprice', 'figure'),
     Output('avg-basement-by-year', 'figure'),
+    Output('filter-store', 'data'),
     Input('zoning-filter', 'value'),
     Input('bldgtype-filter', 'value'),
     State('theme-store', 'data'),
+    State('filter-store', 'data'),
     prevent_initial_call='initial_duplicate'
 )
-def update_graphs(zoning, bldgtype, theme):
+def update_graphs(zoning, bldgtype, theme, last_filters):
     """Update main dashboard1 graphs."""
-    filtered_df = filter_dataframe(df, zoning, bldgtype)
+    check_filters(zoning, bldgtype, last_filters)
+    idx = _filtered_indices(zoning, bldgtype)
     template = get_template(theme)
+    
+    # Gather the filtered columns once; all four figures reuse these arrays
+    price = SALEPRICE[idx]
+    year = YEARBUILT[idx]
+    cond = OVERALLCOND[idx]
+    sold = ~np.isnan(price)  # SalePrice is missing for unsold houses
+    zones = [rows[sold[rows]] for rows in _group_rows(ZONING_CODES[idx], len(ZONING_NAMES))]
 
-    # Sale Price distribution histogram
-    fig1 = px.histogram(
-        filtered_df, x='SalePrice', nbins=50,
-        title='Distribution of Sale Prices', template=template,
-        color='MSZoning',  # Color by zoning type
-        color_discrete_sequence=px.colors.sequential.Plasma_r,
+    # Sale Price distribution histogram, stacked by zoning type
+    fig1 = go.Figure(_histogram_traces(price, zones, ZONING_NAMES))
+    fig1.update_layout(
+        title='Distribution of Sale Prices', template=template, barmode='stack', bargap=0,
+        xaxis_title='SalePrice', yaxis_title='count', legend_title_text='MSZoning'
     )
-      # Year Built vs Sale Price scatter plot
-    fig2 = px.scatter(
-        filtered_df, x='YearBuilt', y='SalePrice',
+    
+    # Year Built vs Sale Price scatter plot (WebGL), one trace per zoning type
+    fig2 = go.Figure()
+    for i, rows in enumerate(zones):
+        if rows.size:
+            fig2.add_trace(go.Scattergl(
+                x=year[rows], y=price[rows], mode='markers',
+                name=ZONING_NAMES[i], marker_color=PALETTE[i % len(PALETTE)],
+                customdata=cond[rows],  # Extra info on hover
+                hovertemplate='YearBuilt=%{x}<br>SalePrice=%{y}<br>OverallCond=%{customdata}<extra></extra>'
+            ))
+    fig2.update_layout(
         title='Year Built vs Sale Price', template=template,
-        color='MSZoning',  # Color by zoning type
-        color_discrete_sequence=px.colors.sequential.Plasma_r,
-        hover_data=['OverallCond'],  # Extra info on hover
+        xaxis_title='YearBuilt', yaxis_title='SalePrice', legend_title_text='MSZoning'
     )
 
-    # Box plot showing sale price by overall condition
-    fig3 = px.box(
-        filtered_df, x='OverallCond', y='SalePrice', color='OverallCond',
+    # Box plot showing sale price by overall condition, from precomputed quartiles
+    fig3 = go.Figure()
+    for j, c in enumerate(np.unique(cond[sold])):
+        fig3.add_traces(_box_traces(c, price[sold & (cond == c)], str(c), PALETTE[j % len(PALETTE)]))
+    fig3.update_layout(
         title='Sale Price by Overall Condition', template=template,
-        color_discrete_sequence=px.colors.sequential.Plasma_r
+        xaxis_title='OverallCond', yaxis_title='SalePrice', legend_title_text='OverallCond'
     )
     
     # Line chart of average basement size by year built
-    fig4 = px.line(
-        filtered_df.groupby('YearBuilt')['TotalBsmtSF'].mean().reset_index(),
-        x='YearBuilt', y='TotalBsmtSF',
+    sums = np.bincount(YEAR_IDX[idx], weights=TBSMT_VALUES[idx], minlength=YEAR_SPAN)
+    counts = np.bincount(YEAR_IDX[idx], weights=TBSMT_VALID[idx], minlength=YEAR_SPAN)
+    has_year = counts > 0
+    fig4 = go.Figure(go.Scatter(
+        x=(YEAR_MIN + np.arange(YEAR_SPAN))[has_year],
+        y=sums[has_year] / counts[has_year],
+        mode='lines', line_color=PALETTE[0]
+    ))
+    fig4.update_layout(
         title='Average Basement Area by Year Built', template=template,
-        color_discrete_sequence=px.colors.sequential.Plasma_r
+        xaxis_title='YearBuilt', yaxis_title='TotalBsmtSF'
     )
 
-    return fig1, fig2, fig3, fig4
+    return fig1, fig2, fig3, fig4, [zoning, bldgtype]
 
 # Dashboard2 additional graphs callback
 @app.callback(
@@ -445,70 +648,89 @@ def update_graphs(zoning, bldgtype, theme):
     Output('yearremod-distribution', 'figure'),
     Output('mssubclass-saleprice', 'figure'),
     Output('lotconfig-saleprice', 'figure'),
+    Output('insights-filter-store', 'data'),
     Input('insights-zoning-filter', 'value'),
     Input('insights-bldgtype-filter', 'value'),
     State('theme-store', 'data'),
+    State('insights-filter-store', 'data'),
     prevent_initial_call='initial_duplicate'
 )
-def update_additional_graphs(zoning, bldgtype, theme):
+def update_additional_graphs(zoning, bldgtype, theme, last_filters):
     """Update additional graphs for dashboard2."""
-    filtered_df = filter_dataframe(df, zoning, bldgtype)  # Apply filters
-    template = get_template(theme)    # LotArea vs SalePrice scatter plot
-    fig5 = px.scatter(
-        filtered_df, 
-        x='LotArea',
-        y='SalePrice',
-        color='MSZoning',  # Color by zoning type
-        color_discrete_sequence=px.colors.sequential.Plasma_r,
-        title='Lot Area vs Sale Price by Zoning', 
-        template=template,
-        hover_data=['YearBuilt'],  # Extra info on hover
-        opacity=0.7  # Semi-transparent points
+    check_filters(zoning, bldgtype, last_filters)
+    idx = _filtered_indices(zoning, bldgtype)
+    template = get_template(theme)
+    
+    # Gather the filtered columns once; all four figures reuse these arrays
+    price = SALEPRICE[idx]
+    lot_area = LOTAREA[idx]
+    year = YEARBUILT[idx]
+    bldg = BLDGTYPE_CODES[idx]
+    sold = ~np.isnan(price)  # SalePrice is missing for unsold houses
+    zones = [rows[sold[rows]] for rows in _group_rows(ZONING_CODES[idx], len(ZONING_NAMES))]
+
+    # LotArea vs SalePrice scatter plot (WebGL), one trace per zoning type
+    fig5 = go.Figure()
+    for i, rows in enumerate(zones):
+        if rows.size:
+            fig5.add_trace(go.Scattergl(
+                x=lot_area[rows], y=price[rows], mode='markers',
+                opacity=0.7,  # Semi-transparent points
+                name=ZONING_NAMES[i], marker=dict(color=PALETTE[i % len(PALETTE)], size=8),
+                customdata=year[rows],  # Extra info on hover
+                hovertemplate='LotArea=%{x}<br>SalePrice=%{y}<br>YearBuilt=%{customdata}<extra></extra>'
+            ))
+    fig5.update_layout(
+        title='Lot Area vs Sale Price by Zoning', template=template,
+        xaxis_title='LotArea', yaxis_title='SalePrice', legend_title_text='Zoning Type'
     )
-    fig5.update_traces(marker={'size': 8})  # Adjust marker size
-    fig5.update_layout(legend_title_text='Zoning Type')
     
-    # Sale Prices histogram with box plot
-    fig6 = px.histogram(
-        filtered_df, 
-        x='SalePrice',
-        nbins=50,  # Number of bins
-        marginal='box',  # Add box plot on side
-        title='Sale Prices', 
-        template=template,
-        color='MSZoning',  # Color by zoning type
-        color_discrete_sequence=px.colors.sequential.Plasma_r,
+    # Sale Prices histogram with a box plot per zoning type above it
+    fig6 = go.Figure(_histogram_traces(price, zones, ZONING_NAMES))
+    for i, rows in enumerate(zones):
+        if rows.size:
+            fig6.add_traces(_box_traces(
+                ZONING_NAMES[i], price[rows], ZONING_NAMES[i], PALETTE[i % len(PALETTE)],
+                horizontal=True, yaxis='y2', legendgroup=ZONING_NAMES[i], showlegend=False
+            ))
+    fig6.update_layout(
+        title='Sale Prices', template=template, barmode='stack', bargap=0,
+        xaxis_title='SalePrice', legend_title_text='MSZoning',
+        yaxis=dict(title='count', domain=[0, 0.74]),
+        yaxis2=dict(domain=[0.76, 1], anchor='x', showticklabels=False)  # Marginal box strip
     )
     
     # Average Price by Building Type horizontal bar chart
-    avg_price_by_bldg = filtered_df.groupby('BldgType')['SalePrice'].mean().sort_values().reset_index()
-    fig7 = px.bar(
-        avg_price_by_bldg, 
-        x='SalePrice',  # Bar length = price
-        y='BldgType',   # Categories on y-axis
-        orientation='h',  # Horizontal bars
-        title='Avg Price by Building Type', 
-        template=template,
-        text_auto=True,  # Show values on bars
-        color='SalePrice',  # Color by price
-        color_continuous_scale=px.colors.sequential.Plasma_r  # Color scale
+    has_bldg = sold & (bldg >= 0)
+    sums = np.bincount(bldg[has_bldg], weights=price[has_bldg], minlength=len(BLDGTYPE_NAMES))
+    counts = np.bincount(bldg[has_bldg], minlength=len(BLDGTYPE_NAMES))
+    present = np.flatnonzero(counts)
+    avg_price = sums[present] / counts[present]
+    order = np.argsort(avg_price)
+    fig7 = go.Figure(go.Bar(
+        x=avg_price[order],                   # Bar length = price
+        y=BLDGTYPE_NAMES[present[order]],     # Categories on y-axis
+        orientation='h',                      # Horizontal bars
+        texttemplate='%{x:.0f}',              # Show values on bars
+        marker=dict(color=avg_price[order], colorscale=PALETTE, colorbar=dict(title='SalePrice'))
+    ))
+    fig7.update_layout(
+        title='Avg Price by Building Type', template=template,
+        xaxis_title='SalePrice', yaxis_title='BldgType'
     )
     
     # Building Type Share pie chart
-    bldg_counts = filtered_df['BldgType'].value_counts().reset_index()
-    bldg_counts.columns = ['BldgType', 'Count']
-    fig8 = px.pie(
-        bldg_counts, 
-        names='BldgType',  # Categories
-        values='Count',    # Slice size
-        hole=0.6,          # Donut chart
-        color='BldgType',  # Color by type
-        color_discrete_sequence=px.colors.sequential.Plasma_r,  # Color palette
-        title='Building Type Share', 
-        template=template
-    )
+    bldg_counts = np.bincount(bldg[bldg >= 0], minlength=len(BLDGTYPE_NAMES))
+    present = np.flatnonzero(bldg_counts)  # Skip unused categories
+    fig8 = go.Figure(go.Pie(
+        labels=BLDGTYPE_NAMES[present],
+        values=bldg_counts[present],   # Slice size
+        hole=0.6,                      # Donut chart
+        marker_colors=[PALETTE[i % len(PALETTE)] for i in present]
+    ))
+    fig8.update_layout(title='Building Type Share', template=template)
 
-    return fig5, fig6, fig7, fig8
+    return fig5, fig6, fig7, fig8, [zoning, bldgtype]
 
 # ======== APP ENTRY POINT ========
 if __name__ == '__main__':
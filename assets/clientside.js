@@ -0,0 +1,13 @@
+// Browser-side callbacks: theme changes never need a server round trip
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    theme: {
+        // Re-template the rendered figures and swap the page theme class
+        restyle: function(theme, templates) {
+            var template = templates[theme];
+            document.querySelectorAll('#page-content .js-plotly-plot').forEach(function(gd) {
+                window.Plotly.relayout(gd, {template: template});
+            });
+            return 'container-fluid p-4 theme-' + theme;
+        }
+    }
+});